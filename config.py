@@ -12,6 +12,12 @@ VIDEO_TOP_CUT_RATIO = 0.5
 HASH_SIZE = 12
 HASH_THRESH = 50
 
+# PROFILING
+PROFILE_SAMPLE_INTERVAL = 0.01  # seconds
+PROFILE_TOP_N = 30
+PROFILE_COLLAPSED_FILENAME = 'profile.collapsed'
+PROFILE_SUMMARY_FILENAME = 'profile_summary.txt'
+
 # TESTS
 TEST_LOG_FOLDER = "../log"
 TEST_DATA_FOLDER = "./test_data"
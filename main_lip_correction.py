@@ -10,6 +10,7 @@ from src.utils import check_folder_structure, mark_frames
 from src.video_utils import (parse_silence_seconds, get_audio_track, get_audio_pauses, make_video,
                              make_stack_video, extract_frames, frames_top_cut)
 from src.class_video_transform import VideoTransform
+from src.profiler import SamplingProfiler
 
 
 @click.command()
@@ -23,7 +24,12 @@ from src.class_video_transform import VideoTransform
               help = 'Make stack video (transformed + corrected) as output.')
 @click.option('--output_folder', '-of', default = './output/', type=click.Path(), required=True,
               help = 'Folder for saving corrected frames.')
-def start_correction(original: str, transformed: str, corrected: str, make_stack: bool, output_folder: str):
+@click.option('--profile', '-pr', is_flag = True, default = False,
+              help = 'Sample Python stacks and ffmpeg calls, save flamegraph and hot functions reports to output folder.')
+def start_correction(original: str, transformed: str, corrected: str, make_stack: bool, output_folder: str,
+                     profile: bool):
+    profiler = SamplingProfiler() if profile else None
+    if profiler: profiler.start()
     try:
         work_dir, output_dir, base_img_dir, transf_img_dir, corrected_img_dir = check_folder_structure(output_folder)
         original_video = Path(original)
@@ -59,6 +65,14 @@ def start_correction(original: str, transformed: str, corrected: str, make_stack
         if not success: raise Exception
     except:
         logger.info(f"Video correction, some errors, reason: {tb.format_exc()}")
+    finally:
+        if profiler:
+            try:
+                profiler.stop()
+                collapsed_file, summary_file = profiler.write_reports(Path(output_folder))
+                logger.info(f"Profile reports saved: {collapsed_file}, {summary_file}")
+            except:
+                logger.info(f"Profile reports saving, some errors, reason: {tb.format_exc()}")
 
 if __name__ == '__main__':
     start_correction()
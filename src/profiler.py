@@ -0,0 +1,142 @@
+
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+
+from config import *
+
+_active_profiler = None
+
+
+@dataclass
+class SamplingProfiler:
+    sample_interval: float = PROFILE_SAMPLE_INTERVAL  # seconds between stack samples
+    thread_id: int = field(default_factory=threading.get_ident)  # profiled thread
+
+    def __post_init__(self):
+        self.stack_counter = Counter()  # (frame, ..., leaf frame) -> samples qnty
+        self.subprocess_calls = []  # (label, command line, duration in seconds)
+        self.current_subprocess = None
+        self.total_time = 0.0
+        self._stop_event = threading.Event()
+        self._sampler = None
+        self._start_time = 0.0
+        self._code_labels = {}  # code object -> formatted frame label
+
+    def start(self):
+        """
+        Start stack sampling in the background thread and make the profiler active
+        for run_subprocess calls.
+        """
+        global _active_profiler
+        self._stop_event.clear()
+        self._start_time = time.perf_counter()
+        self._sampler = threading.Thread(target=self._sample_loop, name='sampling_profiler', daemon=True)
+        self._sampler.start()
+        _active_profiler = self
+
+    def stop(self):
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = None
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self.total_time = time.perf_counter() - self._start_time
+
+    def _sample_loop(self):
+        next_sample_time = time.perf_counter() + self.sample_interval
+        while not self._stop_event.wait(max(next_sample_time - time.perf_counter(), 0)):
+            next_sample_time = max(next_sample_time + self.sample_interval, time.perf_counter())
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            code_labels = self._code_labels
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = code_labels.get(code)
+                if label is None:
+                    label = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                    code_labels[code] = label
+                stack.append(label)
+                frame = frame.f_back
+            stack.reverse()
+            if self.current_subprocess is not None:
+                stack.append(f"[{self.current_subprocess}]")
+            self.stack_counter[tuple(stack)] += 1
+
+    def hot_functions(self, top_n: int = PROFILE_TOP_N) -> List[Tuple[str, int, int]]:
+        """
+        Get the hottest functions by samples qnty
+        :param top_n: functions qnty in the result
+        :return: list of (function, self samples, total samples), sorted by self samples
+        """
+        self_samples = Counter()
+        total_samples = Counter()
+        for stack, samples in self.stack_counter.items():
+            self_samples[stack[-1]] += samples
+            for function in set(stack):
+                total_samples[function] += samples
+        hot_list = [(function, self_samples[function], total_samples[function]) for function in total_samples]
+        hot_list.sort(key=lambda item: (item[1], item[2]), reverse=True)
+        return hot_list[:top_n]
+
+    def write_reports(self, output_dir: Path, top_n: int = PROFILE_TOP_N) -> Tuple[Path, Path]:
+        """
+        Save collapsed stacks (flamegraph.pl / speedscope input) and hot functions summary
+        :param output_dir: folder for report files
+        :param top_n: functions qnty in the summary
+        :return: collapsed stacks file, summary file
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        collapsed_file = output_dir.joinpath(PROFILE_COLLAPSED_FILENAME)
+        with open(collapsed_file, 'w') as file:
+            for stack, samples in sorted(self.stack_counter.items()):
+                file.write(f"{';'.join(stack)} {samples}\n")
+
+        total_samples = sum(self.stack_counter.values())
+        lines = [f"Wall time: {self.total_time:.2f} s, samples: {total_samples}, "
+                 f"sample rate: {total_samples / max(self.total_time, 1e-9):.1f} Hz "
+                 f"(configured {1 / self.sample_interval:.1f} Hz)", '',
+                 f"Top {top_n} hot functions:",
+                 f"{'self %':>8} {'total %':>8}  function"]
+        for function, self_qnty, total_qnty in self.hot_functions(top_n):
+            lines.append(f"{self_qnty / max(total_samples, 1) * 100:>8.1f} "
+                         f"{total_qnty / max(total_samples, 1) * 100:>8.1f}  {function}")
+        subprocess_time = sum(duration for _, _, duration in self.subprocess_calls)
+        lines += ['', f"Subprocess calls: {len(self.subprocess_calls)}, total time: {subprocess_time:.2f} s "
+                      f"({subprocess_time / max(self.total_time, 1e-9) * 100:.1f}% of wall time)"]
+        for label, command, duration in self.subprocess_calls:
+            lines.append(f"{duration:>10.2f} s  {label}: {command}")
+        summary_file = output_dir.joinpath(PROFILE_SUMMARY_FILENAME)
+        with open(summary_file, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+        return collapsed_file, summary_file
+
+
+def run_subprocess(command: List) -> int:
+    """
+    subprocess.check_call wrapper. If profiler is active - save the call duration
+    and mark the stack samples taken during the call with the call label.
+    :param command: command with arguments
+    :return: return code
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return subprocess.check_call(command)
+    label = f"{Path(str(command[0])).name}#{len(profiler.subprocess_calls) + 1} ({sys._getframe(1).f_code.co_name})"
+    profiler.current_subprocess = label
+    start_time = time.perf_counter()
+    try:
+        return subprocess.check_call(command)
+    finally:
+        profiler.current_subprocess = None
+        profiler.subprocess_calls.append((label, ' '.join(str(arg) for arg in command),
+                                          time.perf_counter() - start_time))
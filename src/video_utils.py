@@ -1,5 +1,4 @@
 
-import subprocess
 import traceback as tb
 from pathlib import Path
 from typing import List, Tuple
@@ -9,6 +8,7 @@ import cv2 as cv
 import numpy as np
 
 from src.app_logger import logger
+from src.profiler import run_subprocess
 
 
 def extract_frames(input_mp4_path: Path, img_dir: Path, fps: float) -> (bool, float, float):
@@ -26,7 +26,7 @@ def extract_frames(input_mp4_path: Path, img_dir: Path, fps: float) -> (bool, fl
         if fps == 0:
             video = cv.VideoCapture(str(input_mp4_path))
             fps = video.get(cv.CAP_PROP_FPS)
-        subprocess.check_call(['ffmpeg', '-i', input_mp4_path.resolve(), '-vf', f"fps={fps}", f"{img_dir}/img%05d.jpg"])
+        run_subprocess(['ffmpeg', '-i', input_mp4_path.resolve(), '-vf', f"fps={fps}", f"{img_dir}/img%05d.jpg"])
         video_duration = (len(list(img_dir.glob('*.jpg'))) + 1) / fps
         success = True
     except:
@@ -56,8 +56,8 @@ def get_audio_track(input_mp4_path: Path, output_mp3_path: Path) -> bool:
     success = False
     try:
         if output_mp3_path.is_file(): output_mp3_path.unlink()
-        subprocess.check_call(['ffmpeg', '-i', input_mp4_path.resolve(), '-vn', '-ar', '44100', '-ab', '192K',
-                               '-f', 'mp3', output_mp3_path.resolve()])
+        run_subprocess(['ffmpeg', '-i', input_mp4_path.resolve(), '-vn', '-ar', '44100', '-ab', '192K',
+                        '-f', 'mp3', output_mp3_path.resolve()])
         success = True
     except:
         logger.info(f"get_audio_track: some errors. Reason: {tb.format_exc()}")
@@ -74,8 +74,8 @@ def get_audio_pauses(input_mp3_path: Path, work_dir: Path, silence_level: int=-2
     """
     try:
         temp_text_file = work_dir.joinpath('temp.txt')
-        subprocess.check_call(['./get_silence.sh', input_mp3_path.resolve(), f"{silence_level}dB",
-                               temp_text_file.resolve()])
+        run_subprocess(['./get_silence.sh', input_mp3_path.resolve(), f"{silence_level}dB",
+                        temp_text_file.resolve()])
         with open(temp_text_file.resolve(), 'r') as file:
             lines = file.readlines()
         silence_list = parse_silence_seconds(lines)
@@ -118,11 +118,11 @@ def make_video(image_folder: Path, audio_file: Path, work_dir: Path, output_vide
         temp_video = work_dir.joinpath("temp.mp4")
         if temp_video.is_file(): temp_video.unlink()
         # Create video from images
-        subprocess.check_call(['ffmpeg', '-f', 'image2', '-framerate', f'{fps}', '-pattern_type', 'glob', '-i',
-                               image_folder.joinpath('*.jpg').resolve(), temp_video.resolve()])
+        run_subprocess(['ffmpeg', '-f', 'image2', '-framerate', f'{fps}', '-pattern_type', 'glob', '-i',
+                        image_folder.joinpath('*.jpg').resolve(), temp_video.resolve()])
         # Add audio track
-        subprocess.check_call(['ffmpeg', '-i', audio_file.resolve(), '-i',  temp_video.resolve(),
-                               output_video_file.resolve()])
+        run_subprocess(['ffmpeg', '-i', audio_file.resolve(), '-i',  temp_video.resolve(),
+                        output_video_file.resolve()])
         success = True
         if temp_video.is_file(): temp_video.unlink()
     except:
@@ -175,12 +175,12 @@ def make_stack_video(image_folder_1: Path, image_folder_2: Path, audio_file: Pat
             join_image[:, new_image_size[1]:] = new_right_image
             join_img_file = Path(output_dir, image_file.name)
             cv.imwrite(str(join_img_file), join_image)
-        subprocess.check_call(['ffmpeg', '-f', 'image2', '-framerate', f'{fps}', '-pattern_type', 'glob', '-i',
-                               output_dir.joinpath('*.jpg').resolve(), temp_video.resolve()])
+        run_subprocess(['ffmpeg', '-f', 'image2', '-framerate', f'{fps}', '-pattern_type', 'glob', '-i',
+                        output_dir.joinpath('*.jpg').resolve(), temp_video.resolve()])
 
         # Add audio track
-        subprocess.check_call(['ffmpeg', '-i', audio_file.resolve(), '-i',  temp_video.resolve(),
-                               output_video_file.resolve()])
+        run_subprocess(['ffmpeg', '-i', audio_file.resolve(), '-i',  temp_video.resolve(),
+                        output_video_file.resolve()])
         temp_video.unlink()
         success = True
     except ValueError:
@@ -0,0 +1,72 @@
+from pathlib import Path
+import subprocess
+import time
+
+import pytest
+
+from config import *
+from src import profiler as profiler_module
+from src.profiler import SamplingProfiler, run_subprocess
+
+
+def busy_loop(seconds: float):
+    end_time = time.perf_counter() + seconds
+    while time.perf_counter() < end_time:
+        pass
+
+
+def test_sampling_profiler(tmp_path):
+    profiler = SamplingProfiler(sample_interval=0.005)
+    profiler.start()
+    busy_loop(0.2)
+    run_subprocess(['sleep', '0.2'])
+    profiler.stop()
+    assert len(profiler.subprocess_calls) == 1
+    label, command, duration = profiler.subprocess_calls[0]
+    assert label == 'sleep#1 (test_sampling_profiler)'
+    assert duration >= 0.2
+    hot_list = profiler.hot_functions(5)
+    assert any(function.startswith('busy_loop') for function, _, _ in hot_list)
+    collapsed_file, summary_file = profiler.write_reports(tmp_path)
+    with open(collapsed_file, 'r') as file:
+        lines = file.readlines()
+    assert any('[sleep#1 (test_sampling_profiler)]' in line for line in lines)
+    assert all(line.rsplit(' ', 1)[1].strip().isdigit() for line in lines)
+    with open(summary_file, 'r') as file:
+        assert 'sample rate' in file.readline()
+
+
+def test_run_subprocess_failed_call():
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        with pytest.raises(subprocess.CalledProcessError):
+            run_subprocess(['false'])
+    finally:
+        profiler.stop()
+    assert profiler.current_subprocess is None
+    assert len(profiler.subprocess_calls) == 1
+    assert profiler.subprocess_calls[0][0] == 'false#1 (test_run_subprocess_failed_call)'
+
+
+def test_run_subprocess_without_profiler():
+    assert profiler_module._active_profiler is None
+    assert run_subprocess(['true']) == 0
+    with pytest.raises(subprocess.CalledProcessError):
+        run_subprocess(['false'])
+
+
+def test_profile_option(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from main_lip_correction import start_correction
+
+    monkeypatch.chdir(tmp_path)
+    broken_video = tmp_path.joinpath('broken.mp4')
+    broken_video.write_text('not a video')
+    output_dir = tmp_path.joinpath('output')
+    result = CliRunner().invoke(start_correction, ['-or', str(broken_video), '-tf', str(broken_video),
+                                                   '-cr', str(tmp_path.joinpath('corrected.mp4')),
+                                                   '-of', str(output_dir), '--profile'])
+    assert result.exit_code == 0
+    assert output_dir.joinpath(PROFILE_COLLAPSED_FILENAME).is_file()
+    assert output_dir.joinpath(PROFILE_SUMMARY_FILENAME).is_file()